@@ -10,8 +10,214 @@ import argparse
 import traceback
 from datetime import datetime
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Optional dependencies, imported once at load time
+try:
+    import orjson  # Faster JSON serializer
+except ImportError:
+    orjson = None
+
+# Cleanup of extracted PDF/DOCX text, applied in _post_process_text
+_MERGED_EMAIL_RE = re.compile(r'([a-zA-Z0-9_.+-]+)at([a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)')
+_SPLIT_PHONE_RE = re.compile(r'([0-9]{3})[\s\n]+([0-9]{3})[\s\n]+([0-9]{4})')
+_NORMALIZED_HEADERS = ('EDUCATION', 'EXPERIENCE', 'SKILLS', 'PROJECTS')
+_HEADER_CASE_RE = re.compile('|'.join(f'({header})' for header in _NORMALIZED_HEADERS), re.IGNORECASE)
+_RUN_IN_HEADER_RE = re.compile(r'([^\n])([A-Z]{5,})')
+
+# Contact details, first match wins
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = [re.compile(p) for p in (
+    r'(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',  # (123) 456-7890 or 123-456-7890
+    r'\+\d{1,2}\s\d{3}\s\d{3}\s\d{4}',                       # +1 123 456 7890
+    r'\d{3}[-\.\s]??\d{3}[-\.\s]??\d{4}',                    # 123.456.7890
+    r'\(\d{3}\)\s*\d{3}[-\.\s]??\d{4}'                       # (123) 456-7890
+)]
+_LINKEDIN_URL_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'linkedin\.com/in/[\w-]+',
+    r'linkedin\.com/profile/[\w-]+'
+)]
+
+# Name detection: a capitalized 2-4 word line, or a "Name:" prefix
+_NAME_LINE_RE = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}$')
+_NAME_PREFIX_RE = re.compile(r'(?:Name|NAME):\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})')
+
+# Common technical keywords to look for, fused into one alternation so
+# each description is scanned once
+_TECH_PATTERNS = [
+    r'python|java|javascript|typescript|html|css|c\+\+|ruby|php|swift|kotlin|go|rust|scala|sql',
+    r'react|angular|vue|node|express|django|flask|spring|laravel|rails',
+    r'aws|azure|gcp|docker|kubernetes|terraform|jenkins|git|ci/cd',
+    r'machine learning|ml|ai|data science|nlp|computer vision',
+    r'agile|scrum|kanban|waterfall|leadership|teamwork|communication'
+]
+_TECH_RE = re.compile('|'.join(f'(?:{p})' for p in _TECH_PATTERNS))
+
+# Common section headers in resumes. The header itself is the only capturing
+# group, so re.split() yields [preamble, header, body, header, body, ...]
+_SECTION_PATTERNS = [
+    r'(?:WORK|PROFESSIONAL|EMPLOYMENT)\s?(?:EXPERIENCE|HISTORY)',
+    r'EDUCATION',
+    r'SKILLS',
+    r'PROJECTS?',
+    r'CERTIFICATIONS?',
+    r'LANGUAGES?',
+    r'(?:VOLUNTEER|COMMUNITY)\s?(?:EXPERIENCE|WORK|SERVICE)',
+    r'PUBLICATIONS?',
+    r'AWARDS',
+    r'INTERESTS'
+]
+_COMBINED_SECTION_PATTERN = '|'.join(_SECTION_PATTERNS)
+_SECTION_RE = re.compile(rf'(?:^|\n)({_COMBINED_SECTION_PATTERN})(?::|\n|$)', re.IGNORECASE)
+_LOOSE_SECTION_RE = re.compile(r'\n([A-Z][A-Z\s]{2,}:?)\s*\n')
+
+# Entries within a section are separated by blank lines
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Date ranges (various formats), tried in order
+_DATE_RANGE_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})\s*[-–]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|Present|Current)',
+    r'(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4}|Present|Current)',
+    r'(\d{4})\s*[-–]\s*(\d{4}|Present|Current)'
+)]
+
+# Work experience
+_JOB_TITLE_RE = re.compile(r'^([A-Z][A-Za-z\s,]+)(?:[-–|]|at|\n)', re.MULTILINE)
+_COMPANY_RE = re.compile(r'(?:at|with|for)?\s*([A-Z][A-Za-z0-9\s&,.]+)')
+
+# Education
+_INSTITUTION_RES = [re.compile(p) for p in (
+    r'([A-Z][A-Za-z\s&,]+(?:University|College|Institute|School))',
+    r'((?:University|College|Institute|School)\s+of\s+[A-Z][A-Za-z\s&,]+)'
+)]
+_DEGREE_RE = re.compile(
+    r'(?:Bachelor|Master|Ph\.?D|Doctor|Associate)(?:\'s|s)?\s+(?:of|in|degree\s+in)?\s+([A-Za-z\s&,]+)',
+    re.IGNORECASE
+)
+_GPA_RE = re.compile(r'GPA:?\s*([\d\.]+)', re.IGNORECASE)
+
+# Projects
+_PROJECT_TITLE_RE = re.compile(r'^([A-Z][A-Za-z0-9\s&,.:-]+)', re.MULTILINE)
+
+# Certifications
+_CERT_ISSUER_RE = re.compile(r'(?:issued|awarded|certified)\s+by\s+([A-Za-z\s&,.]+)', re.IGNORECASE)
+_CERT_DATE_RE = re.compile(
+    r'(?:issued|awarded|completed|earned)\s+(?:on|in)\s+(\w+\s+\d{4}|\d{2}/\d{4}|\d{4})',
+    re.IGNORECASE
+)
+
+# Languages: a language name, optionally followed by a proficiency level
+_LANGUAGE_RE = re.compile(
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*[:-]?\s*(Native|Fluent|Professional|Intermediate|Basic|Beginner|Advanced)?'
+)
+
+# Skill categories and their keywords, checked in order
+_SKILL_CATEGORIES = {
+    "Programming Languages": ["python", "java", "javascript", "c++", "c#", "ruby", "php", "swift", "kotlin", "go", "rust", "scala"],
+    "Web Development": ["html", "css", "react", "angular", "vue", "node", "express", "django", "flask"],
+    "Data Science": ["machine learning", "data analysis", "statistics", "jupyter", "pandas", "numpy", "tensorflow", "pytorch", "ai"],
+    "DevOps & Cloud": ["aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "ci/cd", "terraform"],
+    "Databases": ["sql", "nosql", "mongodb", "postgresql", "mysql", "firebase", "redis"],
+    "Mobile Development": ["android", "ios", "flutter", "react native", "swift", "kotlin"],
+    "Soft Skills": ["leadership", "teamwork", "communication", "problem solving", "project management"]
+}
+# One substring alternation per category; the first category that matches wins
+_SKILL_CATEGORY_RES = [
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in _SKILL_CATEGORIES.items()
+]
+
+# Skills and bullet points
+_BULLET_RE = re.compile(r'[•\-*]\s*([^•\-*\n]+)')
+
+# Package relationship that points at a DOCX file's main document part
+_RELATIONSHIP_TAG = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+_OFFICE_DOCUMENT_REL = '/officeDocument'
+
+# WordprocessingML tags used when reading DOCX text
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY, _W_P, _W_R, _W_HYPERLINK = (_W_NS + tag for tag in ('body', 'p', 'r', 'hyperlink'))
+_W_T, _W_BR, _W_TYPE = _W_NS + 't', _W_NS + 'br', _W_NS + 'type'
+# Run children that map to fixed text (w:br is handled separately)
+_W_RUN_TEXT = {_W_NS + 'tab': '\t', _W_NS + 'ptab': '\t', _W_NS + 'cr': '\n', _W_NS + 'noBreakHyphen': '-'}
+
+
+# Characters of text given to a transformer model per call: about 128 tokens,
+# which covers a resume's header and is enough to tell a paragraph's section.
+# Attention cost grows with the square of the sequence length.
+_MODEL_INPUT_CHARS = 500
+
+
+@lru_cache(maxsize=256)
+def _find_keywords(text):
+    """Find the unique tech keywords in text, in first-seen order (cached, as snippets repeat)."""
+    keywords = _TECH_RE.findall(text.lower())
+    return tuple(dict.fromkeys(keywords))  # Remove duplicates
+
+
+@lru_cache(maxsize=512)
+def _categorize_skill_name(skill_name):
+    """Categorize a skill into a group (cached, as skills repeat across entries)."""
+    skill_lower = skill_name.lower()
+    
+    # Check which category the skill belongs to
+    for category, pattern in _SKILL_CATEGORY_RES:
+        if pattern.search(skill_lower):
+            return category
+    
+    # Default category
+    return "Other Skills"
+
+
+@lru_cache(maxsize=None)
+def _load_pdf_backends():
+    """
+    Import the optional PDF text extraction backends on first use.
+    
+    Python does not cache failed imports, so probing a missing package
+    for every PDF would repeat the sys.path search each time.
+    """
+    backends = {}
+    try:
+        from pdfminer.high_level import extract_text
+        backends["pdfminer"] = extract_text
+    except ImportError:
+        pass
+    
+    try:
+        import pytesseract
+        from pdf2image import convert_from_path
+        backends["ocr"] = (convert_from_path, pytesseract.image_to_string)
+    except ImportError:
+        pass
+    
+    try:
+        import PyPDF2
+        backends["pypdf2"] = PyPDF2.PdfReader
+    except ImportError:
+        pass
+    
+    return backends
+
+
+@lru_cache(maxsize=None)
+def _get_pipeline(task):
+    """
+    Build a transformers pipeline for a task once per process.
+    
+    Loading the model dominates the cost of a pipeline, so every paragraph
+    and every resume reuses the same instance. NER entities come back
+    merged into whole words and spans ("entity_group" of ORG, PER, MISC
+    or LOC) rather than one entry per sub-word token.
+    """
+    from transformers import pipeline
+    if task == "ner":
+        return pipeline(task, aggregation_strategy="simple")
+    return pipeline(task)
+
+
 class ResumeImporter:
     """Import resume data from LinkedIn or other formats into a structured JSON format."""
 
@@ -95,82 +301,134 @@ class ResumeImporter:
             "Certifications.csv": self._process_linkedin_certifications
         }
         
-        # Process each file if it exists
+        # Collect the files that exist
+        pending = []
         for filename, processor in file_processors.items():
             file_path = directory_path / filename
             if file_path.exists():
-                processor(file_path)
+                pending.append((processor, file_path))
             else:
                 print(f"Warning: {filename} not found in the LinkedIn export directory.")
+        
+        if not pending:
+            return
+        
+        # Each processor reads its own file and fills its own section of
+        # resume_data, so the files can be processed concurrently
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = [executor.submit(processor, file_path) for processor, file_path in pending]
+            for future in futures:
+                future.result()
+    
+    def _read_linkedin_csv(self, file_path, columns):
+        """
+        Read selected columns from a LinkedIn export CSV file.
+        
+        Column positions are resolved once from the header row, and each
+        row is yielded as a tuple of the requested values. Missing columns
+        and short rows yield empty strings. A leading BOM, which LinkedIn
+        exports often carry, is stripped so the first header still matches.
+        
+        Args:
+            file_path: Path to the CSV file
+            columns: Header names of the columns to read, in order
+        """
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            header_index = {name: i for i, name in enumerate(next(reader, []))}
+            positions = [header_index.get(name) for name in columns]
+            
+            for row in reader:
+                if not row:
+                    continue  # Skip blank lines, as csv.DictReader does
+                width = len(row)
+                yield tuple(row[i] if i is not None and i < width else "" for i in positions)
     
     def _process_linkedin_profile(self, file_path):
         """Process LinkedIn profile data."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Basic information
-                    self.resume_data["basics"]["name"] = row.get("First Name", "") + " " + row.get("Last Name", "")
-                    self.resume_data["basics"]["label"] = row.get("Headline", "")
-                    self.resume_data["basics"]["summary"] = row.get("Summary", "")
-                    
-                    # Location
-                    self.resume_data["basics"]["location"]["city"] = row.get("City", "")
-                    self.resume_data["basics"]["location"]["region"] = row.get("State", "")
-                    self.resume_data["basics"]["location"]["countryCode"] = row.get("Country", "")
-                    
-                    # Add LinkedIn profile
-                    self.resume_data["basics"]["profiles"].append({
-                        "network": "LinkedIn",
-                        "url": row.get("Public Profile Url", ""),
-                        "username": row.get("Vanity Name", "")
-                    })
-                    
-                    # Only process first row as there should only be one profile
-                    break
+            rows = self._read_linkedin_csv(file_path, [
+                "First Name", "Last Name", "Headline", "Summary", "City", "State", "Country",
+                "Public Profile Url", "Vanity Name"
+            ])
+            # Only the first row is used as there should only be one profile
+            row = next(rows, None)
+            rows.close()
+            if row is None:
+                return
+            first_name, last_name, headline, summary, city, state, country, profile_url, vanity_name = row
+            
+            # Basic information
+            self.resume_data["basics"]["name"] = first_name + " " + last_name
+            self.resume_data["basics"]["label"] = headline
+            self.resume_data["basics"]["summary"] = summary
+            
+            # Location
+            self.resume_data["basics"]["location"]["city"] = city
+            self.resume_data["basics"]["location"]["region"] = state
+            self.resume_data["basics"]["location"]["countryCode"] = country
+            
+            # Add LinkedIn profile
+            self.resume_data["basics"]["profiles"].append({
+                "network": "LinkedIn",
+                "url": profile_url,
+                "username": vanity_name
+            })
         except Exception as e:
             print(f"Error processing LinkedIn profile: {e}")
     
     def _process_linkedin_positions(self, file_path):
         """Process LinkedIn work positions."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    work_item = {
-                        "name": row.get("Company Name", ""),
-                        "position": row.get("Title", ""),
-                        "startDate": self._format_linkedin_date(row.get("Started On", "")),
-                        "endDate": self._format_linkedin_date(row.get("Finished On", "")) or "Present",
-                        "summary": row.get("Description", ""),
-                        "highlights": [],
-                        "url": "",
-                        "keywords": self._extract_keywords_from_text(row.get("Description", ""))
-                    }
-                    
-                    # Add the work experience
-                    self.resume_data["work"].append(work_item)
+            rows = self._read_linkedin_csv(file_path, [
+                "Company Name", "Title", "Started On", "Finished On", "Description"
+            ])
+            # Bind per-row calls once, outside the loop
+            format_date = self._format_linkedin_date
+            extract_keywords = self._extract_keywords_from_text
+            add_work = self.resume_data["work"].append
+            
+            for company, title, started_on, finished_on, description in rows:
+                work_item = {
+                    "name": company,
+                    "position": title,
+                    "startDate": format_date(started_on),
+                    "endDate": format_date(finished_on) or "Present",
+                    "summary": description,
+                    "highlights": [],
+                    "url": "",
+                    "keywords": extract_keywords(description) if description else []
+                }
+                
+                # Add the work experience
+                add_work(work_item)
         except Exception as e:
             print(f"Error processing LinkedIn positions: {e}")
     
     def _process_linkedin_education(self, file_path):
         """Process LinkedIn education data."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    education_item = {
-                        "institution": row.get("School Name", ""),
-                        "area": row.get("Field Of Study", ""),
-                        "studyType": row.get("Degree Name", ""),
-                        "startDate": self._format_linkedin_date(row.get("Start Date", "")),
-                        "endDate": self._format_linkedin_date(row.get("End Date", "")) or "Present",
-                        "score": "",
-                        "courses": [course.strip() for course in row.get("Activities and Societies", "").split(",") if course.strip()]
-                    }
-                    
-                    # Add the education
-                    self.resume_data["education"].append(education_item)
+            rows = self._read_linkedin_csv(file_path, [
+                "School Name", "Field Of Study", "Degree Name", "Start Date", "End Date",
+                "Activities and Societies"
+            ])
+            # Bind per-row calls once, outside the loop
+            format_date = self._format_linkedin_date
+            add_education = self.resume_data["education"].append
+            
+            for school, field_of_study, degree, start_date, end_date, activities in rows:
+                education_item = {
+                    "institution": school,
+                    "area": field_of_study,
+                    "studyType": degree,
+                    "startDate": format_date(start_date),
+                    "endDate": format_date(end_date) or "Present",
+                    "score": "",
+                    "courses": [course.strip() for course in activities.split(",") if course.strip()]
+                }
+                
+                # Add the education
+                add_education(education_item)
         except Exception as e:
             print(f"Error processing LinkedIn education: {e}")
     
@@ -179,21 +437,19 @@ class ResumeImporter:
         try:
             # Group skills by category
             skill_categories = {}
+            categorize = self._categorize_skill
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    skill_name = row.get("Name", "")
-                    if not skill_name:
-                        continue
-                        
-                    # Try to categorize the skill
-                    category = self._categorize_skill(skill_name)
-                    
-                    if category not in skill_categories:
-                        skill_categories[category] = []
+            for (skill_name,) in self._read_linkedin_csv(file_path, ["Name"]):
+                if not skill_name:
+                    continue
                     
-                    skill_categories[category].append(skill_name)
+                # Try to categorize the skill
+                category = categorize(skill_name)
+                
+                if category not in skill_categories:
+                    skill_categories[category] = []
+                
+                skill_categories[category].append(skill_name)
             
             # Create skill entries for each category
             for category, skills in skill_categories.items():
@@ -210,56 +466,65 @@ class ResumeImporter:
     def _process_linkedin_languages(self, file_path):
         """Process LinkedIn languages data."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    language_item = {
-                        "language": row.get("Name", ""),
-                        "fluency": row.get("Proficiency", "")
-                    }
-                    
-                    # Add the language
-                    self.resume_data["languages"].append(language_item)
+            add_language = self.resume_data["languages"].append
+            
+            for name, proficiency in self._read_linkedin_csv(file_path, ["Name", "Proficiency"]):
+                language_item = {
+                    "language": name,
+                    "fluency": proficiency
+                }
+                
+                # Add the language
+                add_language(language_item)
         except Exception as e:
             print(f"Error processing LinkedIn languages: {e}")
     
     def _process_linkedin_projects(self, file_path):
         """Process LinkedIn projects data."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    project_item = {
-                        "name": row.get("Title", ""),
-                        "description": row.get("Description", ""),
-                        "startDate": self._format_linkedin_date(row.get("Started On", "")),
-                        "endDate": self._format_linkedin_date(row.get("Finished On", "")) or "Present",
-                        "url": row.get("Url", ""),
-                        "highlights": [],
-                        "keywords": self._extract_keywords_from_text(row.get("Description", ""))
-                    }
-                    
-                    # Add the project
-                    self.resume_data["projects"].append(project_item)
+            rows = self._read_linkedin_csv(file_path, [
+                "Title", "Description", "Started On", "Finished On", "Url"
+            ])
+            # Bind per-row calls once, outside the loop
+            format_date = self._format_linkedin_date
+            extract_keywords = self._extract_keywords_from_text
+            add_project = self.resume_data["projects"].append
+            
+            for title, description, started_on, finished_on, url in rows:
+                project_item = {
+                    "name": title,
+                    "description": description,
+                    "startDate": format_date(started_on),
+                    "endDate": format_date(finished_on) or "Present",
+                    "url": url,
+                    "highlights": [],
+                    "keywords": extract_keywords(description) if description else []
+                }
+                
+                # Add the project
+                add_project(project_item)
         except Exception as e:
             print(f"Error processing LinkedIn projects: {e}")
     
     def _process_linkedin_certifications(self, file_path):
         """Process LinkedIn certifications data."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    cert_item = {
-                        "name": row.get("Name", ""),
-                        "date": self._format_linkedin_date(row.get("Started On", "")),
-                        "issuer": row.get("Authority", ""),
-                        "url": row.get("Url", ""),
-                        "keywords": []
-                    }
-                    
-                    # Add the certification
-                    self.resume_data["certificates"].append(cert_item)
+            rows = self._read_linkedin_csv(file_path, ["Name", "Started On", "Authority", "Url"])
+            # Bind per-row calls once, outside the loop
+            format_date = self._format_linkedin_date
+            add_certificate = self.resume_data["certificates"].append
+            
+            for name, started_on, authority, url in rows:
+                cert_item = {
+                    "name": name,
+                    "date": format_date(started_on),
+                    "issuer": authority,
+                    "url": url,
+                    "keywords": []
+                }
+                
+                # Add the certification
+                add_certificate(cert_item)
         except Exception as e:
             print(f"Error processing LinkedIn certifications: {e}")
     
@@ -268,98 +533,74 @@ class ResumeImporter:
         if not date_str:
             return ""
             
-        # LinkedIn date format is typically MM/DD/YYYY or MM/YYYY
-        parts = date_str.split('/')
-        
-        if len(parts) == 3:  # MM/DD/YYYY
-            month, day, year = parts
-            return f"{year}-{month}"
-        elif len(parts) == 2:  # MM/YYYY
-            month, year = parts
-            return f"{year}-{month}"
-        else:
+        # LinkedIn date format is typically MM/DD/YYYY or MM/YYYY; partition
+        # avoids building a list for every row
+        month, sep, rest = date_str.partition('/')
+        if not sep:
             return date_str  # Return as-is if format is unknown
+        middle, sep, year = rest.partition('/')
+        if not sep:
+            return f"{middle}-{month}"  # MM/YYYY
+        if '/' in year:
+            return date_str  # Too many parts, unknown format
+        return f"{year}-{month}"  # MM/DD/YYYY
     
     def _extract_keywords_from_text(self, text):
         """Extract potential keywords from text."""
-        if not text:
+        # The shortest keywords ("go", "ai", "ml") are two characters long
+        if not text or len(text) < 2 or text.isspace():
             return []
             
-        # Common technical keywords to look for
-        tech_patterns = [
-            r'python|java|javascript|typescript|html|css|c\+\+|ruby|php|swift|kotlin|go|rust|scala|sql',
-            r'react|angular|vue|node|express|django|flask|spring|laravel|rails',
-            r'aws|azure|gcp|docker|kubernetes|terraform|jenkins|git|ci/cd',
-            r'machine learning|ml|ai|data science|nlp|computer vision',
-            r'agile|scrum|kanban|waterfall|leadership|teamwork|communication'
-        ]
-        
-        keywords = []
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text.lower())
-            keywords.extend(matches)
-            
-        return list(set(keywords))  # Remove duplicates
+        # Callers store the list in resume_data, so hand out a fresh copy
+        return list(_find_keywords(text))
     
     def _categorize_skill(self, skill_name):
         """Categorize a skill into a group."""
-        skill_lower = skill_name.lower()
-        
-        # Define categories and their keywords
-        categories = {
-            "Programming Languages": ["python", "java", "javascript", "c++", "c#", "ruby", "php", "swift", "kotlin", "go", "rust", "scala"],
-            "Web Development": ["html", "css", "react", "angular", "vue", "node", "express", "django", "flask"],
-            "Data Science": ["machine learning", "data analysis", "statistics", "jupyter", "pandas", "numpy", "tensorflow", "pytorch", "ai"],
-            "DevOps & Cloud": ["aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "ci/cd", "terraform"],
-            "Databases": ["sql", "nosql", "mongodb", "postgresql", "mysql", "firebase", "redis"],
-            "Mobile Development": ["android", "ios", "flutter", "react native", "swift", "kotlin"],
-            "Soft Skills": ["leadership", "teamwork", "communication", "problem solving", "project management"]
-        }
-        
-        # Check which category the skill belongs to
-        for category, keywords in categories.items():
-            if any(keyword in skill_lower for keyword in keywords):
-                return category
-        
-        # Default category
-        return "Other Skills"
+        return _categorize_skill_name(skill_name)
     
     def import_from_pdf(self, file_path):
         try:
             # Try multiple PDF extraction libraries for better results
             extracted_text = None
+            backends = _load_pdf_backends()
             
             # Option 1: Try pdfminer.six (best structure preservation)
-            try:
-                from pdfminer.high_level import extract_text
-                extracted_text = extract_text(file_path)
+            if "pdfminer" in backends:
+                extracted_text = backends["pdfminer"](file_path)
                 if self.debug:
                     print("Successfully used pdfminer.six")
-            except ImportError:
-                pass
                 
             # Option 2: Try pytesseract if text extraction is poor
-            if not extracted_text or len(extracted_text.strip()) < 100:
+            if (not extracted_text or len(extracted_text.strip()) < 100) and "ocr" in backends:
+                convert_from_path, image_to_string = backends["ocr"]
+                if self.debug:
+                    print("Falling back to OCR with pytesseract")
+                cpus = os.cpu_count() or 1
+                images = convert_from_path(file_path, thread_count=cpus)
+                # Each page is OCR'd by its own tesseract subprocess, so threads
+                # are enough to run them in parallel. Tesseract would otherwise
+                # start one OpenMP thread per core in every subprocess and
+                # oversubscribe the CPU. The subprocesses inherit this limit, and
+                # the caller's own value is put back once OCR is done.
+                omp_thread_limit = os.environ.get("OMP_THREAD_LIMIT")
+                if omp_thread_limit is None:
+                    os.environ["OMP_THREAD_LIMIT"] = "1"
                 try:
-                    import pytesseract
-                    from pdf2image import convert_from_path
-                    if self.debug:
-                        print("Falling back to OCR with pytesseract")
-                    images = convert_from_path(file_path)
-                    extracted_text = ""
-                    for img in images:
-                        extracted_text += pytesseract.image_to_string(img)
-                except ImportError:
-                    pass
+                    workers = max(1, min(len(images), cpus))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        extracted_text = "".join(executor.map(image_to_string, images))
+                finally:
+                    if omp_thread_limit is None:
+                        os.environ.pop("OMP_THREAD_LIMIT", None)
                     
             # Option 3: Fallback to PyPDF2
             if not extracted_text:
-                import PyPDF2
+                if "pypdf2" not in backends:
+                    print("Error: No text could be extracted from the PDF. Install pdfminer.six or PyPDF2.")
+                    return False
                 with open(file_path, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
-                    extracted_text = ""
-                    for page in reader.pages:
-                        extracted_text += page.extract_text()
+                    reader = backends["pypdf2"](f)
+                    extracted_text = "\n".join(page.extract_text() or "" for page in reader.pages)
                 if self.debug:
                     print("Used PyPDF2 as fallback")
                         
@@ -376,7 +617,6 @@ class ResumeImporter:
             self._parse_resume_text(processed_text)
             return True
         except Exception as e:
-            import traceback
             print(f"Error processing PDF resume: {e}")
             if self.debug:
                 traceback.print_exc()
@@ -385,10 +625,7 @@ class ResumeImporter:
     def import_from_docx(self, file_path):
         """Import resume data from a Word document."""
         try:
-            from docx import Document
-            document = Document(file_path)
-            
-            text = "\n".join([para.text for para in document.paragraphs])
+            text = self._read_docx_text(file_path)
             
             if self.debug:
                 print(f"Extracted {len(text)} characters from DOCX")
@@ -400,23 +637,76 @@ class ResumeImporter:
             print(f"Error processing DOCX resume: {e}")
             return False
     
+    def _read_docx_text(self, file_path):
+        """
+        Read the body paragraphs of a DOCX file, one paragraph per line.
+        
+        Parses the main document part directly instead of building
+        python-docx's object model. Run text follows python-docx's
+        Paragraph.text rules.
+        
+        Args:
+            file_path: Path to the DOCX file
+        """
+        # Only DOCX imports need these
+        import zipfile
+        import xml.etree.ElementTree as ET
+        
+        with zipfile.ZipFile(file_path) as archive:
+            # The main part is usually word/document.xml, but not always
+            # (e.g. word/document2.xml), so find it as python-docx does:
+            # through the package's officeDocument relationship
+            with archive.open('_rels/.rels') as f:
+                relationships = ET.parse(f).getroot().iter(_RELATIONSHIP_TAG)
+                main_part = next((
+                    rel.get('Target') for rel in relationships
+                    if rel.get('Type', '').endswith(_OFFICE_DOCUMENT_REL)
+                ), None)
+            if main_part is None:
+                raise ValueError("no officeDocument relationship in _rels/.rels")
+            # Targets are relative to the package root; some writers add a leading /
+            with archive.open(main_part.lstrip('/')) as f:
+                body = ET.parse(f).getroot().find(_W_BODY)
+        
+        lines = []
+        for para in body.iterfind(_W_P):
+            parts = []
+            for child in para:
+                if child.tag == _W_R:
+                    runs = (child,)
+                elif child.tag == _W_HYPERLINK:
+                    runs = child.iterfind(_W_R)
+                else:
+                    continue
+                for run in runs:
+                    for item in run:
+                        tag = item.tag
+                        if tag == _W_T:
+                            parts.append(item.text or "")
+                        elif tag == _W_BR:
+                            # Page and column breaks carry no text
+                            if item.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                                parts.append("\n")
+                        elif tag in _W_RUN_TEXT:
+                            parts.append(_W_RUN_TEXT[tag])
+            lines.append("".join(parts))
+        return "\n".join(lines)
+    
     def _post_process_text(self, text):
         """Post-process extracted text to improve structure recognition."""
         # Fix common PDF extraction issues
         
         # 1. Fix merged email addresses
-        email_pattern = r'([a-zA-Z0-9_.+-]+)at([a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)'
-        text = re.sub(email_pattern, r'\1@\2', text)
+        text = _MERGED_EMAIL_RE.sub(r'\1@\2', text)
         
         # 2. Fix line breaks in contact information
-        text = re.sub(r'([0-9]{3})[\s\n]+([0-9]{3})[\s\n]+([0-9]{4})', r'\1-\2-\3', text)
+        text = _SPLIT_PHONE_RE.sub(r'\1-\2-\3', text)
         
-        # 3. Normalize section headers
-        for section in ['EDUCATION', 'EXPERIENCE', 'SKILLS', 'PROJECTS']:
-            text = re.sub(rf'{section.lower()}', section.upper(), text, flags=re.IGNORECASE)
+        # 3. Normalize section headers (one group per header, in a single pass)
+        text = _HEADER_CASE_RE.sub(lambda m: _NORMALIZED_HEADERS[m.lastindex - 1], text)
         
         # 4. Insert newlines before probable section headers
-        text = re.sub(r'([^\n])([A-Z]{5,})', r'\1\n\n\2', text)
+        text = _RUN_IN_HEADER_RE.sub(r'\1\n\n\2', text)
         
         return text
     
@@ -440,42 +730,22 @@ class ResumeImporter:
         self._extract_personal_info(text)
         self._extract_contact_info(text)
         
-        # Common section headers in resumes
-        section_patterns = [
-            r'(WORK|PROFESSIONAL|EMPLOYMENT)\s?(EXPERIENCE|HISTORY)',
-            r'EDUCATION',
-            r'SKILLS',
-            r'PROJECTS?',
-            r'CERTIFICATIONS?',
-            r'LANGUAGES?',
-            r'(VOLUNTEER|COMMUNITY)\s?(EXPERIENCE|WORK|SERVICE)',
-            r'PUBLICATIONS?',
-            r'AWARDS',
-            r'INTERESTS'
-        ]
-        
-        # Combine patterns for section detection
-        combined_pattern = '|'.join(f'({p})' for p in section_patterns)
-        
-        # Find potential section boundaries
-        section_matches = list(re.finditer(rf'(?:^|\n)({combined_pattern})(?::|\n|$)', text, re.IGNORECASE))
+        # Split the text on section headers in a single pass
+        parts = _SECTION_RE.split(text)
         
-        if not section_matches and self.debug:
+        if len(parts) == 1 and self.debug:
             print("No standard sections found. Trying alternative detection methods.")
             # Try with looser patterns if no sections found
-            section_matches = list(re.finditer(r'\n([A-Z][A-Z\s]{2,}:?)\s*\n', text))
+            parts = _LOOSE_SECTION_RE.split(text)
         
-        # Extract sections
+        # Extract sections - parts alternate header, body after the preamble
         sections = {}
-        for i, match in enumerate(section_matches):
-            section_name = match.group(1).upper()
-            start_idx = match.end()
-            end_idx = section_matches[i+1].start() if i+1 < len(section_matches) else len(text)
-            section_content = text[start_idx:end_idx].strip()
-            sections[section_name] = section_content
-            
-            if self.debug:
-                print(f"Found section: {section_name} ({len(section_content)} chars)")
+        for header, body in zip(parts[1::2], parts[2::2]):
+            sections[header.upper()] = body.strip()
+        
+        if self.debug and sections:
+            print("\n".join(f"Found section: {section_name} ({len(section_content)} chars)"
+                            for section_name, section_content in sections.items()))
         
         # Process each section with specialized extractors
         for section_name, content in sections.items():
@@ -497,11 +767,12 @@ class ResumeImporter:
         # Try multiple name detection approaches
         
         # Approach 1: First few lines, looking for name-like patterns
-        first_lines = text.strip().split('\n')[:7]
+        # Bound the split so long resumes aren't split past the lines we need
+        first_lines = text.strip().split('\n', 7)[:7]
         for line in first_lines:
             line = line.strip()
             # More flexible name pattern (2-4 words, each capitalized)
-            if re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}$', line) and len(line) < 40:
+            if len(line) < 40 and _NAME_LINE_RE.match(line):
                 self.resume_data["basics"]["name"] = line
                 if self.debug:
                     print(f"Found name (pattern match): {line}")
@@ -509,7 +780,7 @@ class ResumeImporter:
                 
         # Approach 2: Look for common name prefix patterns
         if not self.resume_data["basics"]["name"]:
-            name_match = re.search(r'(?:Name|NAME):\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})', text)
+            name_match = _NAME_PREFIX_RE.search(text)
             if name_match:
                 self.resume_data["basics"]["name"] = name_match.group(1)
                 if self.debug:
@@ -518,39 +789,26 @@ class ResumeImporter:
     def _extract_contact_info(self, text):
         """Extract contact information from text."""
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_matches = re.findall(email_pattern, text)
-        if email_matches:
-            self.resume_data["basics"]["email"] = email_matches[0]
+        email_match = _EMAIL_RE.search(text)
+        if email_match:
+            self.resume_data["basics"]["email"] = email_match.group()
             if self.debug:
-                print(f"Found email: {email_matches[0]}")
+                print(f"Found email: {email_match.group()}")
         
         # Extract phone number (various formats)
-        phone_patterns = [
-            r'(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',  # (123) 456-7890 or 123-456-7890
-            r'\+\d{1,2}\s\d{3}\s\d{3}\s\d{4}',                       # +1 123 456 7890
-            r'\d{3}[-\.\s]??\d{3}[-\.\s]??\d{4}',                    # 123.456.7890
-            r'\(\d{3}\)\s*\d{3}[-\.\s]??\d{4}'                       # (123) 456-7890
-        ]
-        
-        for pattern in phone_patterns:
-            phone_matches = re.findall(pattern, text)
-            if phone_matches:
-                self.resume_data["basics"]["phone"] = phone_matches[0]
+        for pattern in _PHONE_RES:
+            phone_match = pattern.search(text)
+            if phone_match:
+                self.resume_data["basics"]["phone"] = phone_match.group()
                 if self.debug:
-                    print(f"Found phone: {phone_matches[0]}")
+                    print(f"Found phone: {phone_match.group()}")
                 break
         
         # Extract LinkedIn URL
-        linkedin_patterns = [
-            r'linkedin\.com/in/[\w-]+',
-            r'linkedin\.com/profile/[\w-]+'
-        ]
-        
-        for pattern in linkedin_patterns:
-            linkedin_matches = re.findall(pattern, text, re.IGNORECASE)
-            if linkedin_matches:
-                url = linkedin_matches[0]
+        for pattern in _LINKEDIN_URL_RES:
+            linkedin_match = pattern.search(text)
+            if linkedin_match:
+                url = linkedin_match.group()
                 if not url.startswith('http'):
                     url = f"https://{url}"
                 
@@ -566,41 +824,27 @@ class ResumeImporter:
     def _extract_work_experience(self, text):
         """Extract work experience from text."""
         # Split into possible job entries (looking for company or title followed by date)
-        job_entries = re.split(r'\n\s*\n', text)
+        job_entries = _PARAGRAPH_SPLIT_RE.split(text)
         
         for entry in job_entries:
             if not entry.strip():
                 continue
                 
             # Look for job title patterns
-            title_match = re.search(r'^([A-Z][A-Za-z\s,]+)(?:[-–|]|at|\n)', entry, re.MULTILINE)
+            title_match = _JOB_TITLE_RE.search(entry)
             title = title_match.group(1).strip() if title_match else ""
             
             # Look for company name
-            company_pattern = r'(?:at|with|for)?\s*([A-Z][A-Za-z0-9\s&,.]+)'
-            company_match = re.search(company_pattern, entry[title_match.end() if title_match else 0:])
+            company_match = _COMPANY_RE.search(entry[title_match.end() if title_match else 0:])
             company = company_match.group(1).strip() if company_match else ""
             
             # Look for dates (various formats)
-            date_patterns = [
-                r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})\s*[-–]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|Present|Current)',
-                r'(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4}|Present|Current)',
-                r'(\d{4})\s*[-–]\s*(\d{4}|Present|Current)'
-            ]
+            start_date, end_date = self._extract_date_range(entry)
             
-            start_date = ""
-            end_date = ""
-            
-            for pattern in date_patterns:
-                date_match = re.search(pattern, entry, re.IGNORECASE)
-                if date_match:
-                    start_date = date_match.group(1)
-                    end_date = date_match.group(2)
-                    break
-            
-            # Extract description
-            description_match = re.search(rf"{company_pattern}.*?(?=\n\n|\Z)", entry, re.DOTALL)
-            description = description_match.group(0).strip() if description_match else ""
+            # Extract description - from the first company-like match to the end of
+            # the entry (entries never contain blank lines, as they were split on them)
+            description_match = _COMPANY_RE.search(entry)
+            description = entry[description_match.start():].strip() if description_match else ""
             
             # Only add if we have at minimum a title or company
             if title or company:
@@ -621,50 +865,30 @@ class ResumeImporter:
     
     def _extract_education(self, text):
         """Extract education from text."""
-        edu_entries = re.split(r'\n\s*\n', text)
+        edu_entries = _PARAGRAPH_SPLIT_RE.split(text)
         
         for entry in edu_entries:
             if not entry.strip():
                 continue
             
             # Look for institution name (universities, colleges)
-            institution_patterns = [
-                r'([A-Z][A-Za-z\s&,]+(?:University|College|Institute|School))',
-                r'((?:University|College|Institute|School)\s+of\s+[A-Z][A-Za-z\s&,]+)'
-            ]
-            
             institution = ""
-            for pattern in institution_patterns:
-                inst_match = re.search(pattern, entry)
+            for pattern in _INSTITUTION_RES:
+                inst_match = pattern.search(entry)
                 if inst_match:
                     institution = inst_match.group(1).strip()
                     break
             
             # Look for degree
-            degree_pattern = r'(?:Bachelor|Master|Ph\.?D|Doctor|Associate)(?:\'s|s)?\s+(?:of|in|degree\s+in)?\s+([A-Za-z\s&,]+)'
-            degree_match = re.search(degree_pattern, entry, re.IGNORECASE)
+            degree_match = _DEGREE_RE.search(entry)
             study_type = degree_match.group(0).strip() if degree_match else ""
             area = degree_match.group(1).strip() if degree_match else ""
             
             # Look for dates
-            date_patterns = [
-                r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})\s*[-–]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|Present|Current)',
-                r'(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4}|Present|Current)',
-                r'(\d{4})\s*[-–]\s*(\d{4}|Present|Current)'
-            ]
-            
-            start_date = ""
-            end_date = ""
-            
-            for pattern in date_patterns:
-                date_match = re.search(pattern, entry, re.IGNORECASE)
-                if date_match:
-                    start_date = date_match.group(1)
-                    end_date = date_match.group(2)
-                    break
+            start_date, end_date = self._extract_date_range(entry)
             
             # Look for GPA
-            gpa_match = re.search(r'GPA:?\s*([\d\.]+)', entry, re.IGNORECASE)
+            gpa_match = _GPA_RE.search(entry)
             score = gpa_match.group(1) if gpa_match else ""
             
             if institution or study_type:
@@ -685,15 +909,15 @@ class ResumeImporter:
     def _extract_skills(self, text):
         """Extract skills from text."""
         # Look for bullet points or comma-separated skills
-        skill_lists = re.findall(r'[•\-*]\s*([^•\-*\n]+)', text)
+        skill_lists = _BULLET_RE.findall(text)
         if not skill_lists:
             # Try comma-separated
             skill_lists = [text]  # Take the entire section
         
         all_skills = []
         for skill_text in skill_lists:
-            # Split by commas or new lines
-            skills = [s.strip() for s in re.split(r',|\n', skill_text) if s.strip()]
+            # Split by commas or new lines (plain string ops, no regex needed)
+            skills = [s.strip() for s in skill_text.replace('\n', ',').split(',') if s.strip()]
             all_skills.extend(skills)
         
         # Group skills by category
@@ -719,60 +943,41 @@ class ResumeImporter:
     def _extract_projects(self, text):
         """Extract projects from text."""
         # Split into possible project entries
-        project_entries = re.split(r'\n\s*\n', text)
+        project_entries = _PARAGRAPH_SPLIT_RE.split(text)
         
         for entry in project_entries:
             if not entry.strip():
                 continue
             
             # Look for project name/title (usually at the beginning of the entry)
-            title_match = re.search(r'^([A-Z][A-Za-z0-9\s&,.:-]+)', entry, re.MULTILINE)
-            project_name = title_match.group(1).strip() if title_match else ""
+            title_match = _PROJECT_TITLE_RE.search(entry)
+            if not title_match:
+                continue  # Entries without a title are not recorded, so skip the remaining scans
+            project_name = title_match.group(1).strip()
             
             # Look for dates
-            date_patterns = [
-                r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})\s*[-–]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|Present|Current)',
-                r'(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4}|Present|Current)',
-                r'(\d{4})\s*[-–]\s*(\d{4}|Present|Current)'
-            ]
-            
-            start_date = ""
-            end_date = ""
-            
-            for pattern in date_patterns:
-                date_match = re.search(pattern, entry, re.IGNORECASE)
-                if date_match:
-                    start_date = date_match.group(1)
-                    end_date = date_match.group(2)
-                    break
+            start_date, end_date = self._extract_date_range(entry)
             
             # Extract description - everything after the title
-            description = entry[title_match.end():].strip() if title_match else entry.strip()
+            description = entry[title_match.end():].strip()
             
-            # Extract keywords from description
-            keywords = self._extract_keywords_from_text(description)
-            
-            # Extract bullet points (highlights)
-            highlights = self._extract_bullet_points(description)
+            project_item = {
+                "name": project_name,
+                "description": description,
+                "startDate": start_date,
+                "endDate": end_date,
+                "url": "",
+                "highlights": self._extract_bullet_points(description),
+                "keywords": self._extract_keywords_from_text(description)
+            }
             
-            if project_name:
-                project_item = {
-                    "name": project_name,
-                    "description": description,
-                    "startDate": start_date,
-                    "endDate": end_date,
-                    "url": "",
-                    "highlights": highlights,
-                    "keywords": keywords
-                }
-                
-                self.resume_data["projects"].append(project_item)
-                if self.debug:
-                    print(f"Added project: {project_name}")
+            self.resume_data["projects"].append(project_item)
+            if self.debug:
+                print(f"Added project: {project_name}")
     
     def _extract_certifications(self, text):
         """Extract certifications from text."""
-        cert_entries = re.split(r'\n\s*\n', text)
+        cert_entries = _PARAGRAPH_SPLIT_RE.split(text)
         
         for entry in cert_entries:
             if not entry.strip():
@@ -780,16 +985,16 @@ class ResumeImporter:
             
             # Look for certification name
             cert_name = ""
-            first_line = entry.split('\n')[0].strip()
+            first_line = entry.partition('\n')[0].strip()
             if first_line:
                 cert_name = first_line
             
             # Look for issuer
-            issuer_match = re.search(r'(?:issued|awarded|certified)\s+by\s+([A-Za-z\s&,.]+)', entry, re.IGNORECASE)
+            issuer_match = _CERT_ISSUER_RE.search(entry)
             issuer = issuer_match.group(1).strip() if issuer_match else ""
             
             # Look for date
-            date_match = re.search(r'(?:issued|awarded|completed|earned)\s+(?:on|in)\s+(\w+\s+\d{4}|\d{2}/\d{4}|\d{4})', entry, re.IGNORECASE)
+            date_match = _CERT_DATE_RE.search(entry)
             date = date_match.group(1) if date_match else ""
             
             if cert_name:
@@ -808,7 +1013,7 @@ class ResumeImporter:
     def _extract_languages(self, text):
         """Extract language skills from text."""
         # Try to find language entries (usually language name followed by proficiency)
-        language_entries = re.findall(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*[:-]?\s*(Native|Fluent|Professional|Intermediate|Basic|Beginner|Advanced)?', text)
+        language_entries = _LANGUAGE_RE.findall(text)
         
         for language, fluency in language_entries:
             if language.strip():
@@ -820,35 +1025,45 @@ class ResumeImporter:
                 if self.debug:
                     print(f"Added language: {language}")
     
+    def _extract_date_range(self, text):
+        """
+        Find the first date range in text, trying each date format in order.
+        
+        Returns:
+            Tuple of (start date, end date), empty strings if none is found
+        """
+        # Every format needs a dash between the dates, so skip the scans without one
+        if '-' in text or '–' in text:
+            for pattern in _DATE_RANGE_RES:
+                date_match = pattern.search(text)
+                if date_match:
+                    return date_match.group(1), date_match.group(2)
+        return "", ""
+    
     def _extract_bullet_points(self, text):
         """Extract bullet points from text."""
-        bullet_points = re.findall(r'[•\-*]\s*([^•\-*\n]+)', text)
-        return [point.strip() for point in bullet_points if point.strip()]
-    
-    def _process_education_with_transformers(self, paragraph):
-        """Process education information using transformer models."""
-        # This would be filled in with actual transformer processing logic
-        # For now, extract basic information
-        from transformers import pipeline
-        
-        # Extract education details
-        ner = pipeline("ner")
-        entities = ner(paragraph)
+        # Most entries have no bullet markers at all; a substring check is much
+        # cheaper than starting the regex engine
+        if '•' not in text and '-' not in text and '*' not in text:
+            return []
         
+        # Strip each match once, then drop the ones that were only whitespace
+        bullet_points = map(str.strip, _BULLET_RE.findall(text))
+        return [point for point in bullet_points if point]
+    
+    def _process_education_with_transformers(self, entities):
+        """Process education information from a paragraph's NER entities."""
         # Look for educational institution and degree
         institution = ""
         degree = ""
-        date = ""
         
         # Process NER results
         # This is a simplified example
         for entity in entities:
-            if entity['entity'] == 'I-ORG' and 'university' in entity['word'].lower():
+            if entity['entity_group'] == 'ORG' and 'university' in entity['word'].lower():
                 institution = entity['word']
-            elif entity['entity'] == 'I-MISC' and any(d in entity['word'].lower() for d in ['bachelor', 'master', 'phd']):
+            elif entity['entity_group'] == 'MISC' and any(d in entity['word'].lower() for d in ['bachelor', 'master', 'phd']):
                 degree = entity['word']
-            elif entity['entity'] == 'I-DATE':
-                date = entity['word']
         
         # Add to resume data if we found meaningful information
         if institution or degree:
@@ -856,42 +1071,35 @@ class ResumeImporter:
                 "institution": institution,
                 "area": "",
                 "studyType": degree,
-                "startDate": date,
+                # The default CoNLL-03 model only tags PER, ORG, LOC and MISC, so no date
+                # comes out of these entities
+                "startDate": "",
                 "endDate": "",
                 "score": "",
                 "courses": []
             })
     
-    def _process_work_with_transformers(self, paragraph):
-        """Process work experience using transformer models."""
-        # This would be filled in with actual transformer processing logic
-        from transformers import pipeline
-        
-        # Extract work details
-        ner = pipeline("ner")
-        entities = ner(paragraph)
-        
+    def _process_work_with_transformers(self, paragraph, entities):
+        """Process work experience from a paragraph's NER entities."""
         # Look for company and position
         company = ""
         position = ""
-        date = ""
         
         # Process NER results
         # This is a simplified example
         for entity in entities:
-            if entity['entity'] == 'I-ORG':
+            if entity['entity_group'] == 'ORG':
                 company = entity['word']
-            elif entity['entity'] == 'I-MISC' and any(p in entity['word'].lower() for p in ['engineer', 'manager', 'developer']):
+            elif entity['entity_group'] == 'MISC' and any(p in entity['word'].lower() for p in ['engineer', 'manager', 'developer']):
                 position = entity['word']
-            elif entity['entity'] == 'I-DATE':
-                date = entity['word']
         
         # Add to resume data if we found meaningful information
         if company or position:
             self.resume_data["work"].append({
                 "name": company,
                 "position": position,
-                "startDate": date,
+                # No DATE entities to take this from; see the education case
+                "startDate": "",
                 "endDate": "",
                 "summary": paragraph,
                 "highlights": [],
@@ -907,9 +1115,10 @@ class ResumeImporter:
             file_path: Path to the JSON file
         """
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                self.resume_data = data
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            # Parse the raw bytes directly instead of decoding to str first
+            self.resume_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             return True
         except Exception as e:
             print(f"Error loading JSON file: {e}")
@@ -918,68 +1127,79 @@ class ResumeImporter:
     def save_to_json(self, output_file):
         """Save the resume data with confidence scores."""
         # Calculate confidence based on how many fields were populated
-        confidence = self._calculate_confidence()
+        populated_fields, confidence = self._field_stats()
         
         # Add metadata to the output
         output_data = {
             "metadata": {
                 "generated_at": datetime.now().isoformat(),
                 "confidence_score": confidence,
-                "fields_extracted": self._count_populated_fields()
+                "fields_extracted": populated_fields
             },
             "resume_data": self.resume_data
         }
         
         try:
-            with open(output_file, 'w') as f:
-                json.dump(output_data, f, indent=2)
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+            else:
+                # Serialize first so the file gets one write, not one per token
+                with open(output_file, 'w') as f:
+                    f.write(json.dumps(output_data, indent=2))
             print(f"Resume data saved to {output_file} (confidence: {confidence:.2f})")
             return True
         except Exception as e:
             print(f"Error saving JSON file: {e}")
             return False
     
-    def _calculate_confidence(self):
-        """Calculate confidence score based on populated fields."""
-        populated_fields = self._count_populated_fields()
-        total_fields = sum(len(section) for section in self.resume_data.values() if isinstance(section, list))
-        return (populated_fields / total_fields) * 100 if total_fields > 0 else 0
-    
-    def _count_populated_fields(self):
-        """Count the number of populated fields in the resume data."""
-        count = 0
+    def _field_stats(self):
+        """
+        Count populated fields and compute the confidence score in one pass.
+        
+        Returns:
+            Tuple of (populated field count, confidence score)
+        """
+        populated_fields = 0
+        total_fields = 0
         for section in self.resume_data.values():
             if isinstance(section, list):
-                count += len(section)
+                populated_fields += len(section)
+                total_fields += len(section)
             elif isinstance(section, dict):
-                count += sum(1 for value in section.values() if value)
-        return count
+                populated_fields += sum(1 for value in section.values() if value)
+        confidence = (populated_fields / total_fields) * 100 if total_fields > 0 else 0
+        return populated_fields, confidence
 
     def _extract_with_transformers(self, text):
         """Extract resume information using transformer models."""
         try:
-            from transformers import pipeline
+            import transformers  # noqa: F401 - fall back to regex methods if missing
+            import torch
             
             if self.debug:
                 print("Using transformer models for enhanced extraction")
                 
             # 1. Named Entity Recognition for contact info and personal details
             try:
-                ner = pipeline("ner")
-                entities = ner(text[:1000])  # Process the first 1000 characters for efficiency
+                ner = _get_pipeline("ner")
+                # The pipelines only run torch.no_grad(); inference_mode() also skips
+                # autograd's version counting and view tracking
+                with torch.inference_mode():
+                    entities = ner(text[:_MODEL_INPUT_CHARS])  # The name and contact details come first
                 
                 # Group entities by type
                 grouped_entities = {}
                 for entity in entities:
-                    if entity['entity'] not in grouped_entities:
-                        grouped_entities[entity['entity']] = []
-                    grouped_entities[entity['entity']].append(entity)
+                    if entity['entity_group'] not in grouped_entities:
+                        grouped_entities[entity['entity_group']] = []
+                    grouped_entities[entity['entity_group']].append(entity)
                 
                 # Extract person name
-                if 'I-PER' in grouped_entities and not self.resume_data["basics"]["name"]:
-                    # Logic to reconstruct name from NER tags
+                if 'PER' in grouped_entities and not self.resume_data["basics"]["name"]:
+                    # Person entities are already merged into whole names
                     name_parts = []
-                    for entity in grouped_entities['I-PER']:
+                    for entity in grouped_entities['PER']:
                         name_parts.append(entity['word'])
                     if name_parts:
                         self.resume_data["basics"]["name"] = " ".join(name_parts)
@@ -991,27 +1211,46 @@ class ResumeImporter:
                 
             # 2. Zero-shot classification for section identification
             try:
-                classifier = pipeline("zero-shot-classification")
+                classifier = _get_pipeline("zero-shot-classification")
                 
                 # Split text into paragraphs
-                paragraphs = [p for p in re.split(r'\n\s*\n', text) if p.strip() and len(p) > 50]
+                paragraphs = [p for p in _PARAGRAPH_SPLIT_RE.split(text) if p.strip() and len(p) > 50]
                 
-                for paragraph in paragraphs:
-                    # Identify which section this paragraph belongs to
-                    result = classifier(
-                        paragraph,
-                        candidate_labels=["education", "work experience", "skills", "projects", "personal information"]
-                    )
-                    
+                # Identify which section each paragraph belongs to, in batched forward
+                # passes. The opening of a paragraph is enough to tell its section, so
+                # long paragraphs are trimmed to the same cap as the NER input above.
+                results = []
+                if paragraphs:
+                    with torch.inference_mode():
+                        results = classifier(
+                            [paragraph[:_MODEL_INPUT_CHARS] for paragraph in paragraphs],
+                            candidate_labels=["education", "work experience", "skills", "projects", "personal information"],
+                            batch_size=8
+                        )
+                
+                education_paragraphs = []
+                work_paragraphs = []
+                for paragraph, result in zip(paragraphs, results):
                     section_type = result['labels'][0]  # Get highest probability section
                     confidence = result['scores'][0]    # Get confidence score
                     
                     if confidence > 0.7:  # Only process if confident enough
                         if section_type == "education":
-                            self._process_education_with_transformers(paragraph)
+                            education_paragraphs.append(paragraph)
                         elif section_type == "work experience":
-                            self._process_work_with_transformers(paragraph)
+                            work_paragraphs.append(paragraph)
                         # Additional sections could be processed here
+                
+                # Run NER over each group of paragraphs in one batched call
+                if education_paragraphs or work_paragraphs:
+                    ner = _get_pipeline("ner")
+                    with torch.inference_mode():
+                        education_entities = ner(education_paragraphs, batch_size=8) if education_paragraphs else []
+                        work_entities = ner(work_paragraphs, batch_size=8) if work_paragraphs else []
+                    for entities in education_entities:
+                        self._process_education_with_transformers(entities)
+                    for paragraph, entities in zip(work_paragraphs, work_entities):
+                        self._process_work_with_transformers(paragraph, entities)
             except Exception as e:
                 if self.debug:
                     print(f"Classification error: {e}")